@@ -6,16 +6,26 @@ Generates consumption graphs and embeds them in README.md
 """
 
 import os
+import io
+import gzip
+import shutil
 import csv
-import json
+import time
+import argparse
+import subprocess
+import threading
+import queue
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from tuya_connector import TuyaOpenAPI
+from tuya_connector.openapi import TUYA_ERROR_CODE_TOKEN_INVALID
+import orjson
 from dotenv import load_dotenv
 import pandas as pd
 from collections import defaultdict
+from contextlib import contextmanager
 
 # Load environment variables
 load_dotenv()
@@ -25,12 +35,58 @@ ACCESS_ID = os.getenv("TUYA_ACCESS_ID")
 ACCESS_KEY = os.getenv("TUYA_ACCESS_KEY") 
 DEVICE_ID = os.getenv("TUYA_DEVICE_ID")
 API_ENDPOINT = os.getenv("TUYA_API_ENDPOINT", "https://openapi.tuyaeu.com")
+DEBUG = os.getenv("DEBUG", "").lower() in ("1", "true", "yes")
+
+# Shared Tuya API client, created by get_client()
+_client = None
 
 # Data storage configuration
 DATA_DIR = Path("data")
 DAILY_DATA_DIR = DATA_DIR / "daily"
 MONTHLY_DATA_DIR = DATA_DIR / "monthly"
 GRAPHS_DIR = DATA_DIR / "graphs"
+README_UPDATED_PREFIX = "Last updated: "
+WRITE_BUFFER_SIZE = 64 * 1024  # Lets all rows queued for a file go out in a single write
+
+# Day names indexed by datetime.weekday(), independent of the system locale
+WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# Daily CSV configuration
+DAILY_HEADERS = [
+    "timestamp",
+    "date",
+    "time",
+    "forward_energy_total_kwh",
+    "hour",
+    "day_of_week",
+    "unix_timestamp"
+]
+# Matches csv.writer output, including its \r\n line terminator
+DAILY_ROW_TEMPLATE = "{timestamp_str},{date},{time},{forward_energy_total},{hour},{day_of_week},{unix_timestamp}\r\n"
+
+# index.html fetches plain daily CSVs for the current month and the last
+# week, up to a day further back in browsers east of UTC; older daily files
+# are gzipped
+DASHBOARD_RECENT_DAYS = 9
+DAILY_COMPRESS_LEVEL = 6
+
+# Monthly summary configuration
+MONTHLY_HEADERS = ["date", "day_of_week", "latest_reading_kwh", "last_updated", "readings_count"]
+MONTHLY_TAIL_READ_SIZE = 4096  # Bytes read from the end of a summary to find its last row
+
+@contextmanager
+def open_atomic(path, mode='w', **kwargs):
+    """Open a temporary file that is fsynced and atomically moved to path when closed"""
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, mode, **kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 def ensure_directories():
     """Create necessary directories if they don't exist"""
@@ -39,149 +95,304 @@ def ensure_directories():
     MONTHLY_DATA_DIR.mkdir(exist_ok=True)
     GRAPHS_DIR.mkdir(exist_ok=True)
 
+def get_client():
+    """Return the shared Tuya API client, connecting on first use"""
+    global _client
+    
+    if _client is None:
+        client = TuyaOpenAPI(API_ENDPOINT, ACCESS_ID, ACCESS_KEY)
+        connect_response = client.connect()
+        
+        if not connect_response.get("success"):
+            raise Exception(f"Tuya connection error: {connect_response.get('msg')}")
+        
+        print(f"🔌 Connecting to Tuya device: {DEVICE_ID}")
+        _client = client
+    
+    return _client
+
 def get_tuya_energy_data():
     """Get forward_energy_total from Tuya smart meter"""
     try:
-        # Initialize API connection
-        openapi = TuyaOpenAPI(API_ENDPOINT, ACCESS_ID, ACCESS_KEY)
-        openapi.connect()
-        
-        print(f"🔌 Connecting to Tuya device: {DEVICE_ID}")
-        
         # Get device status
-        status_response = openapi.get(f"/v1.0/devices/{DEVICE_ID}/status")
+        status_path = f"/v1.0/devices/{DEVICE_ID}/status"
+        status_response = get_client().get(status_path)
+        
+        # On a rejected token the client has already fetched a new one,
+        # so retrying the request once is enough
+        if status_response.get("code") == TUYA_ERROR_CODE_TOKEN_INVALID:
+            print("🔑 Tuya token rejected, retrying...")
+            status_response = get_client().get(status_path)
         
         if not status_response.get("success"):
             raise Exception(f"Tuya API error: {status_response.get('msg')}")
         
         # Parse status data
         status_data = status_response["result"]
-        data_points = {item["code"]: item["value"] for item in status_data}
         
-        print(f"📊 Available data points: {list(data_points.keys())}")
+        if DEBUG:
+            print(f"📊 Available data points: {[item['code'] for item in status_data]}")
         
         # Get forward_energy_total
-        if "forward_energy_total" not in data_points:
+        forward_energy = next(
+            (item["value"] for item in status_data if item["code"] == "forward_energy_total"),
+            None
+        )
+        if forward_energy is None:
             raise Exception("forward_energy_total not found in device data")
         
-        forward_energy = data_points["forward_energy_total"]/100
+        forward_energy = forward_energy/100
         timestamp = datetime.now(timezone.utc)
         
+        # Format the timestamp once here; the writers only use these strings
+        date_str = f"{timestamp.year:04d}-{timestamp.month:02d}-{timestamp.day:02d}"
+        time_str = f"{timestamp.hour:02d}:{timestamp.minute:02d}:{timestamp.second:02d}"
+        timestamp_str = f"{date_str} {time_str} UTC"
+        
         print(f"⚡ Forward Energy Total: {forward_energy} kWh")
-        print(f"🕐 Timestamp: {timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')}")
+        print(f"🕐 Timestamp: {timestamp_str}")
         
         return {
             "timestamp": timestamp,
+            "timestamp_str": timestamp_str,
+            "year_month": date_str[:7],
             "forward_energy_total": forward_energy,
-            "date": timestamp.strftime("%Y-%m-%d"),
-            "time": timestamp.strftime("%H:%M:%S"),
+            "date": date_str,
+            "time": time_str,
             "hour": timestamp.hour,
-            "day_of_week": timestamp.strftime("%A"),
-            "unix_timestamp": int(timestamp.timestamp()),
-            "all_data": data_points
+            "day_of_week": WEEKDAY_NAMES[timestamp.weekday()],
+            "unix_timestamp": int(timestamp.timestamp())
         }
         
     except Exception as e:
         print(f"❌ Error getting Tuya data: {str(e)}")
         raise
 
-def log_to_daily_csv(energy_data):
-    """Log data to daily CSV file"""
-    date_str = energy_data["date"]
-    daily_file = DAILY_DATA_DIR / f"energy_{date_str}.csv"
-    
-    # CSV headers
-    headers = [
-        "timestamp",
-        "date", 
-        "time",
-        "forward_energy_total_kwh",
-        "hour",
-        "day_of_week",
-        "unix_timestamp"
-    ]
-    
-    # Check if file exists to determine if we need headers
-    file_exists = daily_file.exists()
-    
-    # Append data to daily file
-    with open(daily_file, 'a', newline='') as f:
-        writer = csv.writer(f)
-        
-        # Write headers if file is new
-        if not file_exists:
-            writer.writerow(headers)
-            print(f"📝 Created new daily file: {daily_file}")
-        
-        # Write data row
-        row = [
-            energy_data["timestamp"].strftime("%Y-%m-%d %H:%M:%S UTC"),
-            energy_data["date"],
-            energy_data["time"],
-            energy_data["forward_energy_total"],
-            energy_data["hour"],
-            energy_data["day_of_week"],
-            energy_data["unix_timestamp"]
-        ]
-        
-        writer.writerow(row)
-        print(f"✅ Data logged to: {daily_file}")
-
-def log_to_monthly_summary(energy_data):
-    """Log data to monthly summary CSV file"""
-    year_month = energy_data["timestamp"].strftime("%Y-%m")
-    monthly_file = MONTHLY_DATA_DIR / f"energy_summary_{year_month}.csv"
-    
-    # Read existing data if file exists
-    existing_data = []
+def log_to_daily_csv(readings, log=print):
+    """Log a batch of readings to their daily CSV files, reporting progress through log"""
+    # Group readings by day so each daily file is opened once per batch
+    readings_by_date = defaultdict(list)
+    for energy_data in readings:
+        readings_by_date[energy_data["date"]].append(energy_data)
+    
+    for date_str, day_readings in readings_by_date.items():
+        daily_file = DAILY_DATA_DIR / f"energy_{date_str}.csv"
+        
+        # Open for append and check the size of the open file to decide
+        # whether headers are needed, rather than a separate exists() check
+        fd = os.open(daily_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        needs_headers = os.fstat(fd).st_size == 0
+        
+        # Append data to daily file
+        with os.fdopen(fd, 'a', newline='', buffering=WRITE_BUFFER_SIZE) as f:
+            # Write headers if file is new
+            if needs_headers:
+                csv.writer(f).writerow(DAILY_HEADERS)
+                log(f"📝 Created new daily file: {daily_file}")
+            
+            # Every field is a plain date, number or weekday name, so rows can
+            # be formatted directly without going through csv.writer
+            f.write("".join(
+                DAILY_ROW_TEMPLATE.format_map(energy_data)
+                for energy_data in day_readings
+            ))
+            log(f"✅ {len(day_readings)} reading(s) logged to: {daily_file}")
+
+class DailyCSVLogger(threading.Thread):
+    """Background thread that appends queued readings to the daily CSV files"""
+    
+    def __init__(self):
+        super().__init__(name="DailyCSVLogger", daemon=True)
+        self._queue = queue.Queue()
+        self._error = None
+        self._messages = []
+    
+    def log(self, energy_data):
+        """Queue a reading to be written"""
+        self._queue.put(energy_data)
+    
+    def close(self):
+        """Write any queued readings and stop the thread"""
+        self._queue.put(None)
+        self.join()
+        
+        for message in self._messages:
+            print(message)
+        
+        if self._error is not None:
+            raise self._error
+    
+    def run(self):
+        try:
+            stopping = False
+            while not stopping:
+                # Wait for a reading, then take everything else already queued
+                batch = [self._queue.get()]
+                while True:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                
+                stopping = None in batch
+                readings = [energy_data for energy_data in batch if energy_data is not None]
+                
+                if readings:
+                    log_to_daily_csv(readings, log=self._messages.append)
+        except Exception as e:
+            self._error = e
+
+def list_daily_files(date_pattern="*"):
+    """List plain and gzipped daily CSV files whose date matches date_pattern"""
+    return (list(DAILY_DATA_DIR.glob(f"energy_{date_pattern}.csv")) +
+            list(DAILY_DATA_DIR.glob(f"energy_{date_pattern}.csv.gz")))
+
+def daily_file_date(daily_file):
+    """Return the YYYY-MM-DD date of a plain or gzipped daily CSV file"""
+    return daily_file.name.split(".", 1)[0].replace("energy_", "")
+
+def open_daily_csv(daily_file):
+    """Open a plain or gzipped daily CSV file for reading"""
+    if daily_file.suffix == ".gz":
+        return gzip.open(daily_file, 'rt', newline='')
+    return open(daily_file, 'r')
+
+def compress_old_daily_files(today):
+    """Gzip daily CSV files that are no longer read by the dashboard"""
+    keep_from = min(today.replace(day=1), today - timedelta(days=DASHBOARD_RECENT_DAYS - 1))
+    
+    for daily_file in sorted(DAILY_DATA_DIR.glob("energy_*.csv")):
+        try:
+            file_date = datetime.strptime(daily_file_date(daily_file), "%Y-%m-%d").date()
+        except ValueError:
+            continue
+        
+        if file_date >= keep_from:
+            continue
+        
+        compressed_file = daily_file.with_name(daily_file.name + ".gz")
+        
+        try:
+            # Only remove the plain file once the archive is completely in place
+            with open(daily_file, 'rb') as src, open_atomic(compressed_file, 'wb') as raw_dst:
+                with gzip.GzipFile(daily_file.name, mode='wb', compresslevel=DAILY_COMPRESS_LEVEL, fileobj=raw_dst) as dst:
+                    shutil.copyfileobj(src, dst)
+            daily_file.unlink()
+        except Exception as e:
+            # Housekeeping must never stop the reading from being taken
+            print(f"⚠️  Error compressing {daily_file}: {str(e)}")
+            continue
+        
+        print(f"🗜️  Compressed old daily file: {compressed_file}")
+
+def format_csv_rows(rows):
+    """Format rows exactly as csv.writer would and return them as bytes"""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode()
+
+def read_last_monthly_row(f):
+    """Return (offset, date) of the last data row in an open monthly summary, or (size, None) if empty"""
+    size = f.seek(0, os.SEEK_END)
+    block_start = max(0, size - MONTHLY_TAIL_READ_SIZE)
+    f.seek(block_start)
+    tail = f.read().rstrip(b"\r\n")
+    
+    line_start = tail.rfind(b"\n") + 1
+    last_date = tail[line_start:].split(b",", 1)[0].decode()
+    
+    if block_start == 0 and line_start == 0:
+        # Only the header (or nothing) is present
+        return size, None
+    
+    return block_start + line_start, last_date
+
+def rewrite_monthly_summary(monthly_file, entries):
+    """Merge entries into a monthly summary by rewriting the whole file"""
+    # Read existing data if file exists, keyed by date
+    existing_data = {}
     if monthly_file.exists():
         with open(monthly_file, 'r') as f:
             reader = csv.DictReader(f)
-            existing_data = list(reader)
-    
-    # Find if we already have data for this date
-    date_str = energy_data["date"]
-    existing_entry = None
-    for i, row in enumerate(existing_data):
-        if row["date"] == date_str:
-            existing_entry = i
-            break
-    
-    # Calculate daily stats (you could enhance this with more readings per day)
-    new_entry = {
-        "date": date_str,
-        "day_of_week": energy_data["day_of_week"],
-        "latest_reading_kwh": energy_data["forward_energy_total"],
-        "last_updated": energy_data["timestamp"].strftime("%Y-%m-%d %H:%M:%S UTC"),
-        "readings_count": 1
-    }
+            existing_data = {row["date"]: row for row in reader}
     
-    # Update existing entry or add new one
-    if existing_entry is not None:
-        # Update existing entry
-        existing_data[existing_entry] = new_entry
-    else:
-        # Add new entry
-        existing_data.append(new_entry)
-    
-    # Sort by date
-    existing_data.sort(key=lambda x: x["date"])
+    # Update existing entries or add new ones
+    for new_entry in entries:
+        existing_data[new_entry["date"]] = new_entry
     
-    # Write updated data
-    headers = ["date", "day_of_week", "latest_reading_kwh", "last_updated", "readings_count"]
-    with open(monthly_file, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
+    # Write updated data; this path only runs for out-of-order dates, so sort
+    with open_atomic(monthly_file, 'w', newline='', buffering=WRITE_BUFFER_SIZE) as f:
+        writer = csv.DictWriter(f, fieldnames=MONTHLY_HEADERS)
         writer.writeheader()
-        writer.writerows(existing_data)
+        writer.writerows(existing_data[date_str] for date_str in sorted(existing_data))
+
+def log_to_monthly_summary(readings):
+    """Log a batch of readings to their monthly summary CSV files by updating only the last row"""
+    # Keep only the latest reading of each day, grouped by month
+    entries_by_month = defaultdict(dict)
+    for energy_data in readings:
+        date_str = energy_data["date"]
+        
+        # Calculate daily stats (you could enhance this with more readings per day)
+        entries_by_month[energy_data["year_month"]][date_str] = {
+            "date": date_str,
+            "day_of_week": energy_data["day_of_week"],
+            "latest_reading_kwh": energy_data["forward_energy_total"],
+            "last_updated": energy_data["timestamp_str"],
+            "readings_count": 1
+        }
     
-    print(f"📊 Monthly summary updated: {monthly_file}")
+    for year_month, entries in entries_by_month.items():
+        monthly_file = MONTHLY_DATA_DIR / f"energy_summary_{year_month}.csv"
+        entries = list(entries.values())
+        
+        with open(monthly_file, 'a+b', buffering=WRITE_BUFFER_SIZE) as f:
+            last_row_offset, last_date = read_last_monthly_row(f)
+            in_order = last_date is None or entries[0]["date"] >= last_date
+            
+            if in_order:
+                rows = [[entry[key] for key in MONTHLY_HEADERS] for entry in entries]
+                if last_row_offset == 0:
+                    rows.insert(0, MONTHLY_HEADERS)
+                elif entries[0]["date"] == last_date:
+                    # Replace today's row in place
+                    f.truncate(last_row_offset)
+                
+                # Writes in append mode always go to the (new) end of file
+                f.write(format_csv_rows(rows))
+        
+        if not in_order:
+            # Out-of-order reading: fall back to a full rewrite
+            rewrite_monthly_summary(monthly_file, entries)
+        
+        print(f"📊 Monthly summary updated: {monthly_file}")
 
 def create_latest_reading_file(energy_data):
-    """Create a file with the latest reading for easy access"""
+    """Create a file with the latest reading for easy access and a heartbeat file"""
     latest_file = DATA_DIR / "latest_reading.json"
+    heartbeat_file = DATA_DIR / "heartbeat.json"
+    
+    heartbeat_data = {
+        "timestamp": energy_data["timestamp"],
+        "unix_timestamp": energy_data["unix_timestamp"]
+    }
+    with open_atomic(heartbeat_file, 'wb') as f:
+        f.write(orjson.dumps(heartbeat_data, option=orjson.OPT_INDENT_2))
+    
+    # Skip the rewrite for an unchanged reading on the same day
+    if latest_file.exists():
+        try:
+            previous_data = orjson.loads(latest_file.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            previous_data = {}
+        
+        if (previous_data.get("forward_energy_total_kwh") == energy_data["forward_energy_total"] and
+                previous_data.get("date") == energy_data["date"]):
+            print(f"📌 Latest reading unchanged, heartbeat saved: {heartbeat_file}")
+            return
     
     latest_data = {
-        "timestamp": energy_data["timestamp"].isoformat(),
+        "timestamp": energy_data["timestamp"],
         "date": energy_data["date"],
         "time": energy_data["time"],
         "forward_energy_total_kwh": energy_data["forward_energy_total"],
@@ -191,8 +402,9 @@ def create_latest_reading_file(energy_data):
         "formatted_reading": f"{energy_data['forward_energy_total']} kWh at {energy_data['date']} {energy_data['time']} UTC"
     }
     
-    with open(latest_file, 'w') as f:
-        json.dump(latest_data, f, indent=2)
+    # orjson serializes the datetime itself, in the same ISO 8601 form
+    with open_atomic(latest_file, 'wb') as f:
+        f.write(orjson.dumps(latest_data, option=orjson.OPT_INDENT_2))
     
     print(f"📌 Latest reading saved: {latest_file}")
 
@@ -201,7 +413,7 @@ def get_monthly_consumption_data():
     monthly_consumption = {}
     
     # Get all daily files
-    daily_files = list(DAILY_DATA_DIR.glob("energy_*.csv"))
+    daily_files = list_daily_files()
     
     if not daily_files:
         print("⚠️  No daily data files found")
@@ -210,7 +422,7 @@ def get_monthly_consumption_data():
     # Group files by month
     monthly_files = defaultdict(list)
     for file in daily_files:
-        date_str = file.stem.replace("energy_", "")
+        date_str = daily_file_date(file)
         try:
             date_obj = datetime.strptime(date_str, "%Y-%m-%d")
             year_month = date_obj.strftime("%Y-%m")
@@ -228,13 +440,13 @@ def get_monthly_consumption_data():
         
         try:
             # Read first day's first reading
-            with open(first_day_file, 'r') as f:
+            with open_daily_csv(first_day_file) as f:
                 reader = csv.DictReader(f)
                 first_reading = next(reader)
                 month_start_energy = float(first_reading['forward_energy_total_kwh'])
             
             # Read last day's last reading
-            with open(last_day_file, 'r') as f:
+            with open_daily_csv(last_day_file) as f:
                 reader = csv.DictReader(f)
                 last_reading = None
                 for row in reader:
@@ -263,22 +475,22 @@ def get_daily_consumption_data(target_month=None):
     daily_consumption = {}
     
     # Get all daily files for the target month
-    daily_files = list(DAILY_DATA_DIR.glob(f"energy_{target_month}-*.csv"))
+    daily_files = list_daily_files(f"{target_month}-*")
     
     if not daily_files:
         print(f"⚠️  No daily data files found for {target_month}")
         return daily_consumption
     
     # Sort files by date
-    daily_files.sort()
+    daily_files.sort(key=daily_file_date)
     
     prev_day_last_reading = None
     
     for i, file in enumerate(daily_files):
-        date_str = file.stem.replace("energy_", "")
+        date_str = daily_file_date(file)
         
         try:
-            with open(file, 'r') as f:
+            with open_daily_csv(file) as f:
                 reader = csv.DictReader(f)
                 rows = list(reader)
                 
@@ -413,9 +625,8 @@ def create_readme():
     latest_reading = "N/A"
     if latest_file.exists():
         try:
-            with open(latest_file, 'r') as f:
-                latest_data = json.load(f)
-                latest_reading = latest_data.get("formatted_reading", "N/A")
+            latest_data = orjson.loads(latest_file.read_bytes())
+            latest_reading = latest_data.get("formatted_reading", "N/A")
         except:
             pass
     
@@ -453,6 +664,7 @@ def create_readme():
 
 ### Daily Data (`daily/`)
 - Individual CSV files for each day: `energy_YYYY-MM-DD.csv`
+- Files older than the current month and the last {DASHBOARD_RECENT_DAYS} days are gzipped: `energy_YYYY-MM-DD.csv.gz`
 - Contains hourly readings with timestamp, energy total, and metadata
 - New file created automatically for each day
 
@@ -467,9 +679,13 @@ def create_readme():
 
 ### Latest Reading (`latest_reading.json`)
 - Always contains the most recent energy reading
-- Updated every hour
+- Updated whenever the reading changes, and at least once a day
 - Easy to parse for current status
 
+### Heartbeat (`heartbeat.json`)
+- Time of the most recent successful reading
+- Updated on every run, even when the reading is unchanged
+
 ## 📊 Data Columns
 
 **Daily Files:**
@@ -497,15 +713,62 @@ Data is automatically collected every hour using GitHub Actions.
 - **Monthly Consumption**: Difference between last reading of the month and first reading of the month
 - **Daily Consumption**: Difference between last reading of the day and last reading of the previous day
 
-Last updated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}
 """
     
-    with open(readme_file, 'w') as f:
+    # Skip the write (and the resulting commit) if only the timestamp would change
+    if readme_file.exists():
+        with open(readme_file, 'r') as f:
+            existing_content = f.read()
+        existing_content = existing_content.rsplit(README_UPDATED_PREFIX, 1)[0]
+        if existing_content == readme_content:
+            print(f"📖 README unchanged, skipping write: {readme_file}")
+            return
+    
+    readme_content += f"{README_UPDATED_PREFIX}{datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
+    
+    with open_atomic(readme_file) as f:
         f.write(readme_content)
     
     print(f"📖 README updated with graphs: {readme_file}")
 
-def main():
+def commit_data_files(reading_count):
+    """Stage everything under the data directory and record it in a single git commit"""
+    subprocess.run(["git", "add", "--all", "--", str(DATA_DIR)], check=True)
+    
+    staged_files = subprocess.run(
+        ["git", "diff", "--cached", "--name-only", "--", str(DATA_DIR)],
+        check=True, capture_output=True, text=True
+    ).stdout.split()
+    
+    # Nothing staged means the files did not actually change
+    if not staged_files:
+        print("📭 No data changes to commit")
+        return
+    
+    message = f"Update energy data - {reading_count} reading(s) - {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}"
+    # Limit the commit to data/ so unrelated staged work is left alone
+    subprocess.run(["git", "commit", "--quiet", "-m", message, "--", str(DATA_DIR)], check=True)
+    print(f"📦 Committed {len(staged_files)} file(s) in one commit")
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Log Tuya smart meter energy readings")
+    parser.add_argument("--batch-count", type=int, default=1,
+                        help="Number of readings to collect before writing to disk (default: 1)")
+    parser.add_argument("--interval", type=float, default=60.0,
+                        help="Seconds to wait between readings in a batch (default: 60)")
+    parser.add_argument("--commit", action="store_true",
+                        help="Commit all data changes from the batch in a single git commit")
+    args = parser.parse_args()
+    
+    if args.batch_count < 1:
+        parser.error("--batch-count must be at least 1")
+    if args.interval < 0:
+        parser.error("--interval must not be negative")
+    
+    return args
+
+def main(batch_count=1, interval=60.0, commit=False):
     """Main execution function"""
     print("🚀 Tuya Energy Logger Starting...")
     print("=" * 50)
@@ -522,14 +785,38 @@ def main():
         # Ensure directories exist
         ensure_directories()
         
-        # Get energy data from Tuya
-        energy_data = get_tuya_energy_data()
+        # Compress daily files from earlier days that the dashboard no longer reads
+        compress_old_daily_files(datetime.now(timezone.utc).date())
+        
+        # Collect the batch of readings from Tuya, logging each one to the
+        # daily CSV in the background while the next one is fetched
+        readings = []
+        daily_logger = DailyCSVLogger()
+        daily_logger.start()
+        try:
+            for i in range(batch_count):
+                if i > 0:
+                    time.sleep(interval)
+                
+                # A failed poll only loses that reading, not the whole batch
+                try:
+                    energy_data = get_tuya_energy_data()
+                except Exception as e:
+                    print(f"⚠️  Skipping reading {i + 1}/{batch_count}: {str(e)}")
+                    continue
+                
+                readings.append(energy_data)
+                daily_logger.log(energy_data)
+        finally:
+            daily_logger.close()
+        
+        if not readings:
+            raise Exception("No readings could be collected from Tuya")
         
-        # Log to daily CSV
-        log_to_daily_csv(energy_data)
+        energy_data = readings[-1]
         
         # Log to monthly summary
-        log_to_monthly_summary(energy_data)
+        log_to_monthly_summary(readings)
         
         # Create latest reading file
         create_latest_reading_file(energy_data)
@@ -537,7 +824,12 @@ def main():
         # Create/update README with graphs
         create_readme()
         
+        # Record the whole batch in one commit
+        if commit:
+            commit_data_files(len(readings))
+        
         print("\n🎉 Energy logging completed successfully!")
+        print(f"📦 Readings in batch: {len(readings)}")
         print(f"📊 Energy Reading: {energy_data['forward_energy_total']} kWh")
         print(f"📅 Date: {energy_data['date']} {energy_data['time']} UTC")
         
@@ -548,5 +840,6 @@ def main():
         return False
 
 if __name__ == "__main__":
-    success = main()
+    args = parse_args()
+    success = main(batch_count=args.batch_count, interval=args.interval, commit=args.commit)
     exit(0 if success else 1)